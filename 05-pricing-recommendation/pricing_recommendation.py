@@ -79,6 +79,167 @@ def recommend_pricing_tier(projects_created, storage_used_gb, team_members,
         "confidence": confidence
     }
 
+# --- Recomendación incremental (event-driven) ---
+
+# Orden de planes, de menor a mayor valor (para detectar upgrades)
+PLAN_ORDER = ["Free", "Starter", "Pro", "Enterprise"]
+
+# Umbrales que usa recommend_pricing_tier en cada dimensión.
+# inclusive=False → la condición es "valor > umbral"; inclusive=True → "valor >= umbral".
+# Mientras el valor no cruce ningún umbral, el plan recomendado no puede cambiar.
+USAGE_BOUNDARIES = {
+    "projects_created": {"thresholds": (5, 20), "inclusive": False},
+    "storage_used_gb": {"thresholds": (1, 10), "inclusive": False},
+    "team_members": {"thresholds": (1, 3, 10), "inclusive": False},
+    "support_tickets_last_month": {"thresholds": (5,), "inclusive": True},
+}
+
+
+def _usage_band(dimension, value):
+    """
+    Devuelve los límites (low, high) de la franja de uso que contiene el valor.
+
+    Args:
+        dimension (str): Nombre de la dimensión (clave de USAGE_BOUNDARIES)
+        value (float): Uso actual en esa dimensión
+
+    Returns:
+        tuple: (low, high) con math.inf / -math.inf en los extremos abiertos
+    """
+    boundary = USAGE_BOUNDARIES[dimension]
+    low, high = -math.inf, math.inf
+    for threshold in boundary["thresholds"]:
+        crossed = value >= threshold if boundary["inclusive"] else value > threshold
+        if crossed:
+            low = threshold
+        else:
+            high = threshold
+            break
+    return low, high
+
+
+def _within_band(dimension, value, band):
+    """Indica si el valor sigue dentro de la franja (low, high) guardada."""
+    low, high = band
+    if USAGE_BOUNDARIES[dimension]["inclusive"]:
+        return low <= value < high
+    return low < value <= high
+
+
+class IncrementalPricingRecommender:
+    """
+    Recomendador de plan incremental basado en eventos de cambio de uso.
+
+    Guarda por cuenta el uso actual, el plan recomendado y la franja de uso
+    (headroom) en cada dimensión. Un evento sólo recalcula la recomendación
+    si el nuevo valor sale de su franja, así que el coste escala con los
+    cruces de límite y no con el número total de cuentas.
+    """
+
+    def __init__(self):
+        # account_id -> {"usage": dict, "bands": dict, "plan": str}
+        self.accounts = {}
+
+    def add_account(self, account_id, projects_created=0, storage_used_gb=0,
+                    team_members=0, support_tickets_last_month=0):
+        """
+        Registra una cuenta y calcula su recomendación inicial.
+
+        Returns:
+            dict: Recomendación inicial (mismo formato que recommend_pricing_tier)
+        """
+        usage = {
+            "projects_created": projects_created,
+            "storage_used_gb": storage_used_gb,
+            "team_members": team_members,
+            "support_tickets_last_month": support_tickets_last_month,
+        }
+        state = {"usage": usage, "bands": {}, "plan": None}
+        self.accounts[account_id] = state
+        return self._rescore(state)
+
+    def _rescore(self, state):
+        """Recalcula plan y franjas de una cuenta a partir de su uso actual."""
+        usage = state["usage"]
+        result = recommend_pricing_tier(**usage)
+        state["plan"] = result["recommended_plan"]
+        state["bands"] = {
+            dimension: _usage_band(dimension, value)
+            for dimension, value in usage.items()
+        }
+        return result
+
+    def apply_delta(self, account_id, dimension, delta):
+        """
+        Aplica un cambio de uso a una cuenta.
+
+        Args:
+            account_id: Identificador de la cuenta (debe estar registrada)
+            dimension (str): Dimensión que cambia (clave de USAGE_BOUNDARIES)
+            delta (float): Incremento (positivo) o decremento (negativo)
+
+        Returns:
+            dict | None: Upgrade trigger si la cuenta cruza a un plan superior,
+            None en otro caso
+        """
+        if dimension not in USAGE_BOUNDARIES:
+            raise ValueError(f"Unknown usage dimension: {dimension}")
+
+        state = self.accounts[account_id]
+        new_value = max(0, state["usage"][dimension] + delta)
+        state["usage"][dimension] = new_value
+
+        # Caso común: sigue dentro de su franja → el plan no puede cambiar
+        if _within_band(dimension, new_value, state["bands"][dimension]):
+            return None
+
+        previous_plan = state["plan"]
+        result = self._rescore(state)
+        if PLAN_ORDER.index(result["recommended_plan"]) <= PLAN_ORDER.index(previous_plan):
+            return None
+
+        return {
+            "account_id": account_id,
+            "previous_plan": previous_plan,
+            "recommended_plan": result["recommended_plan"],
+            "crossed_dimension": dimension,
+            "reasoning": result["reasoning"],
+            "upsell_trigger": result["upsell_trigger"],
+            "confidence": result["confidence"],
+        }
+
+    def process_events(self, events):
+        """
+        Procesa un lote de eventos (account_id, dimension, delta) en orden.
+
+        Returns:
+            list: Upgrade triggers emitidos, en el orden en que se produjeron
+        """
+        triggers = []
+        for account_id, dimension, delta in events:
+            trigger = self.apply_delta(account_id, dimension, delta)
+            if trigger is not None:
+                triggers.append(trigger)
+        return triggers
+
+    def headroom(self, account_id):
+        """
+        Margen restante en cada dimensión hasta el siguiente límite de plan.
+
+        Returns:
+            dict: dimensión -> unidades restantes (math.inf si no hay límite)
+        """
+        state = self.accounts[account_id]
+        return {
+            dimension: high - state["usage"][dimension]
+            for dimension, (_, high) in state["bands"].items()
+        }
+
+    def recommended_plan(self, account_id):
+        """Devuelve el plan recomendado actualmente para la cuenta."""
+        return self.accounts[account_id]["plan"]
+
+
 # --- Test Cases (optional, for validation) ---
 print("=== EJERCICIO 5: Pricing Tier Recommendation ===\n")
 
@@ -104,3 +265,23 @@ for i, (p, s, t, st) in enumerate(tests):
     print(f"  Reasoning: {result['reasoning']}")
     print(f"  Upsell Trigger: {result['upsell_trigger']}")
     print(f"  Confidence: {result['confidence']}\n")
+
+# --- Incremental recommender demo ---
+print("=== Incremental Re-recommendation ===\n")
+
+recommender = IncrementalPricingRecommender()
+recommender.add_account("acme", projects_created=4, storage_used_gb=0.5, team_members=1)
+recommender.add_account("globex", projects_created=12, storage_used_gb=6, team_members=2)
+
+events = [
+    ("acme", "projects_created", 1),      # 5 proyectos → sigue en Free
+    ("acme", "projects_created", 1),      # 6 proyectos → cruza a Starter
+    ("globex", "storage_used_gb", 2),     # 8 GB → sigue en Starter
+    ("globex", "team_members", 2),        # 4 users → cruza a Pro
+]
+
+for trigger in recommender.process_events(events):
+    print(f"  [{trigger['account_id']}] {trigger['previous_plan']} → {trigger['recommended_plan']} "
+          f"(crossed: {trigger['crossed_dimension']})")
+    print(f"    Upsell Trigger: {trigger['upsell_trigger']}")
+print(f"\n  Headroom acme: {recommender.headroom('acme')}")